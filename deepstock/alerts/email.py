@@ -3,15 +3,134 @@
 from __future__ import annotations
 
 import logging
-import re
 import smtplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from typing import Optional
+from typing import Any, Optional
+
+from deepstock.alerts.formatter import strip_html
 
 logger = logging.getLogger(__name__)
 
 
+class SMTPSession:
+    """A reusable SMTP connection for sending several emails in one batch.
+
+    The connection (STARTTLS + LOGIN) is opened lazily on the first send and
+    kept alive until the context exits, so a batch of alerts pays the
+    handshake once instead of once per message. After a failed login the
+    session stops trying, so bad credentials are not retried per message.
+
+    Example:
+        with SMTPSession(host, port, user, password) as session:
+            session.send(to_address, subject, body_html)
+    """
+
+    def __init__(
+        self,
+        smtp_host: str,
+        smtp_port: int,
+        smtp_user: str,
+        smtp_password: str,
+        timeout: float = 30,
+    ) -> None:
+        self.smtp_host = smtp_host
+        self.smtp_port = smtp_port
+        self.smtp_user = smtp_user
+        self.smtp_password = smtp_password
+        self.timeout = timeout
+        self._server: Optional[smtplib.SMTP] = None
+        self._auth_failed = False
+
+    def __enter__(self) -> SMTPSession:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open and authenticate a new SMTP connection."""
+        server = smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=self.timeout)
+        try:
+            server.starttls()
+            server.login(self.smtp_user, self.smtp_password)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    def _is_alive(self) -> bool:
+        """Check that the cached connection still answers a NOOP."""
+        if self._server is None:
+            return False
+        try:
+            return self._server.noop()[0] == 250
+        except (smtplib.SMTPServerDisconnected, OSError):
+            return False
+
+    def close(self) -> None:
+        """Close the connection if one is open."""
+        if self._server is None:
+            return
+        try:
+            self._server.quit()
+        except (smtplib.SMTPException, OSError):
+            self._server.close()
+        self._server = None
+
+    def send(
+        self,
+        to_address: str,
+        subject: str,
+        body_html: str,
+        body_text: Optional[str] = None,
+    ) -> bool:
+        """Send an email over the session connection.
+
+        Args:
+            to_address: Recipient email address.
+            subject: Email subject.
+            body_html: HTML body content.
+            body_text: Plain text fallback (auto-generated if not provided).
+
+        Returns:
+            True if email was sent successfully.
+        """
+        msg = MIMEMultipart("alternative")
+        msg["Subject"] = subject
+        msg["From"] = self.smtp_user
+        msg["To"] = to_address
+
+        if not body_text:
+            body_text = strip_html(body_html)
+
+        msg.attach(MIMEText(body_text, "plain"))
+        msg.attach(MIMEText(body_html, "html"))
+
+        if self._auth_failed:
+            logger.warning("Skipping email to %s: SMTP authentication already failed", to_address)
+            return False
+
+        try:
+            server = self._server if self._is_alive() else None
+            if server is None:
+                self.close()
+                server = self._server = self._connect()
+            server.send_message(msg)
+            logger.info("Sent email alert to %s: %s", to_address, subject)
+            return True
+        except smtplib.SMTPAuthenticationError:
+            self._auth_failed = True
+            logger.error("SMTP authentication failed. Check credentials.")
+            return False
+        except smtplib.SMTPException as e:
+            logger.error("SMTP error: %s", e)
+            return False
+        except Exception as e:
+            logger.error("Failed to send email: %s", e)
+            return False
+
+
 def send_email(
     smtp_host: str,
     smtp_port: int,
@@ -24,6 +143,9 @@ def send_email(
 ) -> bool:
     """Send an email alert via SMTP.
 
+    Opens a one-off connection; use ``SMTPSession`` to send several emails
+    over the same connection.
+
     Args:
         smtp_host: SMTP server hostname.
         smtp_port: SMTP server port.
@@ -37,30 +159,5 @@ def send_email(
     Returns:
         True if email was sent successfully.
     """
-    msg = MIMEMultipart("alternative")
-    msg["Subject"] = subject
-    msg["From"] = smtp_user
-    msg["To"] = to_address
-
-    if not body_text:
-        body_text = re.sub(r"<[^>]+>", "", body_html)
-
-    msg.attach(MIMEText(body_text, "plain"))
-    msg.attach(MIMEText(body_html, "html"))
-
-    try:
-        with smtplib.SMTP(smtp_host, smtp_port, timeout=30) as server:
-            server.starttls()
-            server.login(smtp_user, smtp_password)
-            server.send_message(msg)
-        logger.info("Sent email alert to %s: %s", to_address, subject)
-        return True
-    except smtplib.SMTPAuthenticationError:
-        logger.error("SMTP authentication failed. Check credentials.")
-        return False
-    except smtplib.SMTPException as e:
-        logger.error("SMTP error: %s", e)
-        return False
-    except Exception as e:
-        logger.error("Failed to send email: %s", e)
-        return False
+    with SMTPSession(smtp_host, smtp_port, smtp_user, smtp_password) as session:
+        return session.send(to_address, subject, body_html, body_text)
@@ -2,9 +2,27 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import io
+import re
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Optional
 
+from deepstock.analysis.filter import BUY_TYPES
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_ALERT_DIVIDER = "\n\n" + "━" * 24 + "\n\n"
+
+
+@lru_cache(maxsize=512)
+def strip_html(html: str) -> str:
+    """Strip HTML tags from an alert message.
+
+    Cached so an alert that is both rendered as plain text and sent as an
+    email plain-text part is only stripped once.
+    """
+    return _TAG_RE.sub("", html)
+
 
 def format_breaking_alert(trade: dict[str, Any], analysis: Optional[dict[str, Any]] = None) -> str:
     """Format a breaking insider trade alert as HTML.
@@ -16,20 +34,21 @@ def format_breaking_alert(trade: dict[str, Any], analysis: Optional[dict[str, An
     Returns:
         HTML-formatted alert string.
     """
-    tx_type = trade.get("transaction_type", "").upper()
-    action_emoji = "🟢 BUY" if tx_type in ("P", "BUY", "A") else "🔴 SELL"
-    value = trade.get("value", 0)
-    score = trade.get("score", 0)
+    get = trade.get
+    tx_type = get("_tx_upper") or get("transaction_type", "").upper()
+    action_emoji = "🟢 BUY" if tx_type in BUY_TYPES else "🔴 SELL"
+    value = get("value", 0)
+    score = get("score", 0)
 
     lines = [
         "🚨 <b>DEEPSTOCK ALERT — Insider Trade Detected</b>",
         "",
         f"📋 <b>Trade Details</b>",
-        f"  Insider: <b>{trade.get('insider_name', 'Unknown')}</b> ({trade.get('insider_title', '')})",
-        f"  Company: <b>{trade.get('ticker', '???')}</b>",
-        f"  Action:  {action_emoji} · {trade.get('shares', 0):,} shares @ ${trade.get('price', 0):.2f}",
+        f"  Insider: <b>{get('insider_name', 'Unknown')}</b> ({get('insider_title', '')})",
+        f"  Company: <b>{get('ticker', '???')}</b>",
+        f"  Action:  {action_emoji} · {get('shares', 0):,} shares @ ${get('price', 0):.2f}",
         f"  Value:   <b>${value:,.0f}</b>",
-        f"  Date:    {trade.get('date', 'Unknown')}",
+        f"  Date:    {get('date', 'Unknown')}",
         f"  Score:   {'█' * int(score)} {score:.1f}/10",
     ]
 
@@ -50,54 +69,71 @@ def format_breaking_alert(trade: dict[str, Any], analysis: Optional[dict[str, An
 
 def format_breaking_alert_text(trade: dict[str, Any], analysis: Optional[dict[str, Any]] = None) -> str:
     """Format a breaking alert as plain text."""
-    import re
-    html = format_breaking_alert(trade, analysis)
-    return re.sub(r"<[^>]+>", "", html)
+    return strip_html(format_breaking_alert(trade, analysis))
+
+
+def format_alert_batch(alerts: list[str]) -> str:
+    """Combine several formatted alerts into a single message.
+
+    Alerts are separated by a plain divider line rather than ``<hr>``,
+    which Telegram's HTML parse mode does not accept.
+
+    Args:
+        alerts: HTML-formatted alert strings.
+
+    Returns:
+        HTML-formatted combined alert.
+    """
+    return _ALERT_DIVIDER.join(alerts)
 
 
 def format_daily_digest(
     trades: list[dict[str, Any]],
     patterns: Optional[dict[str, Any]] = None,
+    today: Optional[str] = None,
 ) -> str:
     """Format a daily digest of trades as HTML.
 
     Args:
         trades: List of scored/analyzed trade records.
         patterns: Optional pattern detection results.
+        today: Digest date as YYYY-MM-DD (defaults to the current UTC date).
 
     Returns:
         HTML-formatted daily digest.
     """
-    today = datetime.utcnow().strftime("%Y-%m-%d")
-    lines = [
-        f"📊 <b>DEEPSTOCK DAILY DIGEST — {today}</b>",
-        f"Found <b>{len(trades)}</b> notable insider trades today.",
-        "",
-    ]
+    if today is None:
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    buf = io.StringIO()
+    write = buf.write
+    write(f"📊 <b>DEEPSTOCK DAILY DIGEST — {today}</b>\n")
+    write(f"Found <b>{len(trades)}</b> notable insider trades today.\n")
+    write("\n")
 
     if patterns and patterns.get("patterns"):
-        lines.append("🔍 <b>Patterns Detected:</b>")
+        write("🔍 <b>Patterns Detected:</b>\n")
         for p in patterns["patterns"]:
             tickers = ", ".join(p.get("tickers", []))
-            lines.append(f"  • [{p.get('type', '')}] {tickers}: {p.get('description', '')}")
-        lines.append("")
+            write(f"  • [{p.get('type', '')}] {tickers}: {p.get('description', '')}\n")
+        write("\n")
 
-    lines.append("<b>Top Trades:</b>")
+    write("<b>Top Trades:</b>\n")
     for i, trade in enumerate(trades[:10], 1):
-        tx_type = trade.get("transaction_type", "").upper()
-        emoji = "🟢" if tx_type in ("P", "BUY", "A") else "🔴"
-        lines.append(
-            f"  {i}. {emoji} <b>{trade.get('ticker', '???')}</b> — "
-            f"{trade.get('insider_name', 'Unknown')} — "
-            f"${trade.get('value', 0):,.0f} — "
-            f"Score: {trade.get('score', 0):.1f}/10"
+        get = trade.get
+        tx_type = get("_tx_upper") or get("transaction_type", "").upper()
+        emoji = "🟢" if tx_type in BUY_TYPES else "🔴"
+        write(
+            f"  {i}. {emoji} <b>{get('ticker', '???')}</b> — "
+            f"{get('insider_name', 'Unknown')} — "
+            f"${get('value', 0):,.0f} — "
+            f"Score: {get('score', 0):.1f}/10\n"
         )
 
     if patterns and patterns.get("summary"):
-        lines.extend(["", f"📈 <b>Market Sentiment:</b> {patterns['summary']}"])
+        write(f"\n📈 <b>Market Sentiment:</b> {patterns['summary']}\n")
 
-    lines.extend(["", "— deepstock-bot 🤖"])
-    return "\n".join(lines)
+    write("\n— deepstock-bot 🤖")
+    return buf.getvalue()
 
 
 def format_pattern_alert(patterns: dict[str, Any]) -> str:
@@ -3,13 +3,24 @@
 from __future__ import annotations
 
 import logging
+import time
+from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
 TELEGRAM_API = "https://api.telegram.org/bot{token}"
 
+# Shared session so multi-chunk messages and consecutive alerts reuse one
+# keep-alive TLS connection to api.telegram.org.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Longest Retry-After we will wait out before giving up on a rate-limited send
+MAX_RETRY_AFTER = 30
+
 
 def send_message(
     token: str,
@@ -34,13 +45,19 @@ def send_message(
     chunks = _split_message(text, max_length=4000)
 
     for chunk in chunks:
+        payload = {
+            "chat_id": chat_id,
+            "text": chunk,
+            "parse_mode": parse_mode,
+            "disable_web_page_preview": disable_preview,
+        }
         try:
-            response = requests.post(url, json={
-                "chat_id": chat_id,
-                "text": chunk,
-                "parse_mode": parse_mode,
-                "disable_web_page_preview": disable_preview,
-            }, timeout=30)
+            response = _SESSION.post(url, json=payload, timeout=30)
+            retry_after = _retry_after(response)
+            if retry_after is not None:
+                logger.warning("Telegram rate limit hit, retrying in %ds", retry_after)
+                time.sleep(retry_after)
+                response = _SESSION.post(url, json=payload, timeout=30)
             response.raise_for_status()
             result = response.json()
             if not result.get("ok"):
@@ -54,20 +71,65 @@ def send_message(
     return True
 
 
+def send_messages(
+    token: str,
+    chat_id: str,
+    texts: list[str],
+    parse_mode: str = "HTML",
+    disable_preview: bool = True,
+) -> list[bool]:
+    """Send several messages, in order, via Telegram Bot API.
+
+    Messages go out one after another over the shared keep-alive session,
+    so they arrive in the order given and stay within Telegram's per-chat
+    rate limit.
+
+    Args:
+        token: Telegram bot token.
+        chat_id: Target chat ID.
+        texts: Message texts (HTML or Markdown).
+        parse_mode: Parse mode (HTML or Markdown).
+        disable_preview: Disable link previews.
+
+    Returns:
+        Per-message success flags, in the order of ``texts``.
+    """
+    return [send_message(token, chat_id, text, parse_mode, disable_preview) for text in texts]
+
+
+def _retry_after(response: requests.Response) -> Optional[int]:
+    """Return the wait requested by a 429 response, or None to not retry."""
+    if response.status_code != 429:
+        return None
+    try:
+        retry_after = int(response.json()["parameters"]["retry_after"])
+    except (ValueError, KeyError, TypeError):
+        header = response.headers.get("Retry-After", "")
+        retry_after = int(header) if header.isdigit() else 1
+    return retry_after if retry_after <= MAX_RETRY_AFTER else None
+
+
 def _split_message(text: str, max_length: int = 4000) -> list[str]:
-    """Split a long message into chunks respecting Telegram limits."""
+    """Split a long message into chunks respecting Telegram limits.
+
+    Splits at the last newline within each window, walking ``text`` by index
+    so each chunk is sliced once rather than re-slicing the remainder.
+    """
     if len(text) <= max_length:
         return [text]
 
     chunks = []
-    while text:
-        if len(text) <= max_length:
-            chunks.append(text)
-            break
-        split_at = text.rfind("\n", 0, max_length)
-        if split_at == -1:
-            split_at = max_length
-        chunks.append(text[:split_at])
-        text = text[split_at:].lstrip("\n")
+    start = 0
+    end = len(text)
+    while end - start > max_length:
+        split_at = text.rfind("\n", start, start + max_length)
+        if split_at <= start:
+            split_at = start + max_length
+        chunks.append(text[start:split_at])
+        start = split_at
+        while start < end and text[start] == "\n":
+            start += 1
 
+    if start < end:
+        chunks.append(text[start:])
     return chunks
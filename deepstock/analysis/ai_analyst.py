@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import re
-from typing import Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from string import Formatter
+from typing import Any, Callable, Optional
+
+from deepstock import jsonutil
 
 logger = logging.getLogger(__name__)
 
@@ -59,11 +65,63 @@ Provide your analysis in this JSON format:
 }}"""
 
 
+# Fenced code block (```json ... ```) wrapping an LLM's JSON answer
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.+?)```", re.DOTALL)
+
+# Trade fields sent to the pattern detector, keyed by their prompt name
+_PATTERN_FIELDS: tuple[tuple[str, str, Any], ...] = (
+    ("ticker", "ticker", ""),
+    ("insider", "insider_name", ""),
+    ("title", "insider_title", ""),
+    ("type", "transaction_type", ""),
+    ("value", "value", 0),
+    ("date", "date", ""),
+    ("source", "source", ""),
+)
+
+# Pattern results keyed by provider, model and trade-window fingerprint, so an
+# unchanged window (the common case in watch mode) skips the LLM call
+_PATTERN_CACHE: dict[str, dict[str, Any]] = {}
+_PATTERN_CACHE_SIZE = 32
+
+
+def _compile_template(template: str) -> list[tuple[str, Optional[str], str]]:
+    """Pre-parse a ``str.format`` template into (literal, field, format_spec) segments."""
+    return [(literal, field, spec or "") for literal, field, spec, _ in Formatter().parse(template)]
+
+
+def _render_template(segments: list[tuple[str, Optional[str], str]], **values: Any) -> str:
+    """Render a template pre-parsed by ``_compile_template``."""
+    return "".join(
+        literal if field is None else literal + format(values[field], spec)
+        for literal, field, spec in segments
+    )
+
+
+# TRADE_ANALYSIS_PROMPT is rendered once per analyzed trade; parse it once
+_TRADE_PROMPT_SEGMENTS = _compile_template(TRADE_ANALYSIS_PROMPT)
+
+
+# SDK clients are cached per API key so their HTTP connection pools survive
+# across calls; the SDK import runs once, on first use.
+@lru_cache(maxsize=4)
+def _openai_client(api_key: str) -> Any:
+    """Return a shared OpenAI client for an API key."""
+    import openai
+    return openai.OpenAI(api_key=api_key)
+
+
+@lru_cache(maxsize=4)
+def _anthropic_client(api_key: str) -> Any:
+    """Return a shared Anthropic client for an API key."""
+    import anthropic
+    return anthropic.Anthropic(api_key=api_key)
+
+
 def _call_openai(api_key: str, model: str, prompt: str) -> Optional[str]:
     """Call OpenAI API for completion."""
     try:
-        import openai
-        client = openai.OpenAI(api_key=api_key)
+        client = _openai_client(api_key)
         response = client.chat.completions.create(
             model=model,
             messages=[{"role": "user", "content": prompt}],
@@ -82,8 +140,7 @@ def _call_openai(api_key: str, model: str, prompt: str) -> Optional[str]:
 def _call_anthropic(api_key: str, model: str, prompt: str) -> Optional[str]:
     """Call Anthropic API for completion."""
     try:
-        import anthropic
-        client = anthropic.Anthropic(api_key=api_key)
+        client = _anthropic_client(api_key)
         response = client.messages.create(
             model=model,
             max_tokens=1000,
@@ -98,15 +155,19 @@ def _call_anthropic(api_key: str, model: str, prompt: str) -> Optional[str]:
         return None
 
 
+_PROVIDERS: dict[str, Callable[[str, str, str], Optional[str]]] = {
+    "openai": _call_openai,
+    "anthropic": _call_anthropic,
+}
+
+
 def _call_llm(provider: str, api_key: str, model: str, prompt: str) -> Optional[str]:
     """Route to the appropriate LLM provider."""
-    if provider == "openai":
-        return _call_openai(api_key, model, prompt)
-    elif provider == "anthropic":
-        return _call_anthropic(api_key, model, prompt)
-    else:
+    call = _PROVIDERS.get(provider)
+    if call is None:
         logger.error("Unknown AI provider: %s", provider)
         return None
+    return call(api_key, model, prompt)
 
 
 def _parse_json_response(text: Optional[str]) -> Optional[dict[str, Any]]:
@@ -114,20 +175,21 @@ def _parse_json_response(text: Optional[str]) -> Optional[dict[str, Any]]:
     if not text:
         return None
     try:
-        return json.loads(text)
+        return jsonutil.loads(text)
     except json.JSONDecodeError:
         pass
-    match = re.search(r"```(?:json)?\s*(.+?)```", text, re.DOTALL)
-    if match:
-        try:
-            return json.loads(match.group(1))
-        except json.JSONDecodeError:
-            pass
+    if "```" in text:
+        match = _FENCE_RE.search(text)
+        if match:
+            try:
+                return jsonutil.loads(match.group(1))
+            except json.JSONDecodeError:
+                pass
     start = text.find("{")
     end = text.rfind("}")
     if start != -1 and end != -1:
         try:
-            return json.loads(text[start:end + 1])
+            return jsonutil.loads(text[start:end + 1])
         except json.JSONDecodeError:
             pass
     logger.warning("Failed to parse JSON from LLM response")
@@ -153,7 +215,8 @@ def analyze_trade(
     Returns:
         Analysis dict with significance_score, sentiment, headline, analysis.
     """
-    prompt = TRADE_ANALYSIS_PROMPT.format(
+    prompt = _render_template(
+        _TRADE_PROMPT_SEGMENTS,
         insider_name=trade.get("insider_name", "Unknown"),
         insider_title=trade.get("insider_title", "Unknown"),
         ticker=trade.get("ticker", "???"),
@@ -178,6 +241,38 @@ def analyze_trade(
     return result
 
 
+def analyze_trades(
+    trades: list[dict[str, Any]],
+    provider: str = "openai",
+    api_key: str = "",
+    model: str = "gpt-4",
+    max_workers: int = 5,
+) -> list[Optional[dict[str, Any]]]:
+    """Analyze several trades concurrently using an LLM.
+
+    Each trade is an independent request, so the calls are issued in
+    parallel instead of paying one full round-trip per trade.
+
+    Args:
+        trades: Trade record dicts with standard fields.
+        provider: AI provider ("openai" or "anthropic").
+        api_key: API key for the provider.
+        model: Model name to use.
+        max_workers: Maximum number of concurrent LLM requests.
+
+    Returns:
+        Analysis dicts (or None on failure), in the order of ``trades``.
+    """
+    if not trades:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(trades))) as executor:
+        return list(executor.map(
+            lambda trade: analyze_trade(trade, provider=provider, api_key=api_key, model=model),
+            trades,
+        ))
+
+
 def detect_patterns(
     trades: list[dict[str, Any]],
     provider: str = "openai",
@@ -195,22 +290,29 @@ def detect_patterns(
     Returns:
         Pattern analysis dict.
     """
-    simplified = []
-    for t in trades[:50]:
-        simplified.append({
-            "ticker": t.get("ticker", ""),
-            "insider": t.get("insider_name", ""),
-            "title": t.get("insider_title", ""),
-            "type": t.get("transaction_type", ""),
-            "value": t.get("value", 0),
-            "date": t.get("date", ""),
-            "source": t.get("source", ""),
-        })
-
-    prompt = PATTERN_DETECTION_PROMPT.format(trades_json=json.dumps(simplified, indent=2))
+    rows = [
+        tuple(t.get(field, default) for _, field, default in _PATTERN_FIELDS)
+        for t in trades[:50]
+    ]
+    cache_key = hashlib.blake2b(
+        repr((provider, model, rows)).encode(), digest_size=16,
+    ).hexdigest()
+
+    cached = _PATTERN_CACHE.get(cache_key)
+    if cached is not None:
+        logger.info("Trades unchanged since last pattern detection — reusing result")
+        return cached
+
+    names = [name for name, _, _ in _PATTERN_FIELDS]
+    simplified = [dict(zip(names, row)) for row in rows]
+
+    prompt = PATTERN_DETECTION_PROMPT.format(trades_json=jsonutil.dumps_indented(simplified))
     response = _call_llm(provider, api_key, model, prompt)
     result = _parse_json_response(response)
 
     if result:
         logger.info("Pattern detection found %d patterns", result.get("patterns_found", 0))
+        _PATTERN_CACHE[cache_key] = result
+        if len(_PATTERN_CACHE) > _PATTERN_CACHE_SIZE:
+            del _PATTERN_CACHE[next(iter(_PATTERN_CACHE))]
     return result
@@ -3,6 +3,11 @@
 from __future__ import annotations
 
 import logging
+import re
+import sys
+from bisect import bisect_right
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -29,18 +34,122 @@ HIGH_SIGNAL_TITLES: set[str] = {
     "director", "10% owner", "officer",
 }
 
+# Transaction type codes (already uppercased) for purchases and sales
+BUY_TYPES: frozenset[str] = frozenset({"P", "BUY", "A"})
+SELL_TYPES: frozenset[str] = frozenset({"S", "SELL", "D"})
+
+# Lookup tables derived from NOTABLE_INSIDERS: full names, the individual
+# words of those names, and the word counts needed to window a candidate name
+_NOTABLE_LOWER: frozenset[str] = frozenset(n.lower() for n in NOTABLE_INSIDERS)
+_NOTABLE_WORDS: frozenset[str] = frozenset(w for n in _NOTABLE_LOWER for w in n.split())
+_NOTABLE_WORD_COUNTS: tuple[int, ...] = tuple(sorted({len(n.split()) for n in _NOTABLE_LOWER}))
+
+# All high-signal titles in one alternation, longest first so specific forms
+# like "chief executive" are tried before shorter ones
+_TITLE_RE = re.compile("|".join(
+    re.escape(t) for t in sorted(HIGH_SIGNAL_TITLES, key=len, reverse=True)
+))
+
+# Trade value tiers: a value >= _VALUE_THRESHOLDS[i] earns _VALUE_POINTS[i + 1]
+_VALUE_THRESHOLDS: tuple[int, ...] = (50_000, 100_000, 500_000, 1_000_000, 10_000_000)
+_VALUE_POINTS: tuple[float, ...] = (0.0, 0.5, 1.0, 2.0, 3.0, 4.0)
+
 
 def is_notable_insider(name: str) -> bool:
-    """Check if an insider is in the notable insiders list."""
-    name_lower = name.lower().strip()
-    return any(notable.lower() in name_lower or name_lower in notable.lower()
-               for notable in NOTABLE_INSIDERS)
+    """Check if an insider is in the notable insiders list.
+
+    Matches a notable full name appearing as consecutive words of ``name``
+    (e.g. "Hon. Nancy Pelosi"), or a single-word name that is part of a
+    notable name (e.g. "Pelosi").
+    """
+    return _is_notable_lower(name.lower())
 
 
 def is_high_signal_title(title: str) -> bool:
     """Check if the insider's title indicates a high-signal trade."""
-    title_lower = title.lower()
-    return any(t in title_lower for t in HIGH_SIGNAL_TITLES)
+    return _is_high_signal_lower(title.lower())
+
+
+# The same insiders and titles recur across many filings in a scan (and
+# across scans in watch mode), so each distinct string is classified once.
+@lru_cache(maxsize=2048)
+def _is_notable_lower(name_lower: str) -> bool:
+    """Notable-insider check for an already lowercased name."""
+    words = name_lower.split()
+    if len(words) == 1:
+        return words[0] in _NOTABLE_WORDS
+    return any(
+        " ".join(words[i:i + n]) in _NOTABLE_LOWER
+        for n in _NOTABLE_WORD_COUNTS
+        for i in range(len(words) - n + 1)
+    )
+
+
+@lru_cache(maxsize=512)
+def _is_high_signal_lower(title_lower: str) -> bool:
+    """High-signal title check for an already lowercased title."""
+    return _TITLE_RE.search(title_lower) is not None
+
+
+def normalize_trade(trade: dict[str, Any]) -> dict[str, Any]:
+    """Precompute case-folded copies of the fields used for scoring and alerts.
+
+    Adds ``_tx_upper``, ``_insider_lower``, ``_title_lower`` and
+    ``_source_lower`` so scoring and formatting don't re-fold the same
+    strings for every trade. Called once per trade at ingest.
+
+    Args:
+        trade: Trade record dict (modified in place).
+
+    Returns:
+        The same trade dict.
+    """
+    trade["_tx_upper"] = sys.intern(trade.get("transaction_type", "").upper())
+    trade["_insider_lower"] = trade.get("insider_name", "").lower()
+    trade["_title_lower"] = trade.get("insider_title", "").lower()
+    trade["_source_lower"] = trade.get("source", "").lower()
+    return trade
+
+
+def dedupe_trades(trades: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Drop trades that another source already reported.
+
+    Two records are the same trade when ticker, insider name, transaction
+    type, transaction date, filing day, share count and value all match.
+    Only records from different sources are collapsed: rows from one
+    source are separate transactions even when they look identical (e.g.
+    two congressional trades disclosed in the same value range). The first
+    record, in source order, is kept unchanged.
+
+    Args:
+        trades: Trade record dicts.
+
+    Returns:
+        Unique trades, in order of first appearance.
+    """
+    seen: dict[tuple[Any, ...], set[str]] = {}
+    unique: list[dict[str, Any]] = []
+
+    for trade in trades:
+        key = (
+            (trade.get("ticker") or "").upper(),
+            (trade.get("insider_name") or "").lower().strip(),
+            (trade.get("transaction_type") or "").upper(),
+            (trade.get("date") or "")[:10],
+            (trade.get("filing_date") or "")[:10],
+            trade.get("shares", 0),
+            trade.get("value", 0),
+        )
+        source = trade.get("source", "")
+        sources = seen.setdefault(key, set())
+        if sources and source not in sources:
+            continue
+        sources.add(source)
+        unique.append(trade)
+
+    if len(unique) < len(trades):
+        logger.info("Dropped %d trades already reported by another source", len(trades) - len(unique))
+    return unique
 
 
 def score_trade(trade: dict[str, Any]) -> float:
@@ -59,38 +168,38 @@ def score_trade(trade: dict[str, Any]) -> float:
     Returns:
         Interest score from 0.0 to 10.0.
     """
-    score = 0.0
-    value = trade.get("value", 0)
+    # Use the fields precomputed by normalize_trade when present; otherwise
+    # fold them locally so the caller's dict is left untouched.
+    if "_tx_upper" in trade:
+        tx_type = trade["_tx_upper"]
+        insider_lower = trade["_insider_lower"]
+        title_lower = trade["_title_lower"]
+        source_lower = trade["_source_lower"]
+    else:
+        tx_type = trade.get("transaction_type", "").upper()
+        insider_lower = trade.get("insider_name", "").lower()
+        title_lower = trade.get("insider_title", "").lower()
+        source_lower = trade.get("source", "").lower()
 
     # Value scoring (0-4 points)
-    if value >= 10_000_000:
-        score += 4.0
-    elif value >= 1_000_000:
-        score += 3.0
-    elif value >= 500_000:
-        score += 2.0
-    elif value >= 100_000:
-        score += 1.0
-    elif value >= 50_000:
-        score += 0.5
+    score = _VALUE_POINTS[bisect_right(_VALUE_THRESHOLDS, trade.get("value", 0))]
 
     # Notable insider bonus (0-2 points)
-    if is_notable_insider(trade.get("insider_name", "")):
+    if _is_notable_lower(insider_lower):
         score += 2.0
 
     # Title bonus (0-1.5 points)
-    if is_high_signal_title(trade.get("insider_title", "")):
+    if _is_high_signal_lower(title_lower):
         score += 1.5
 
     # Buy bonus (0-1.5 points)
-    tx_type = trade.get("transaction_type", "").upper()
-    if tx_type in ("P", "BUY", "A"):
+    if tx_type in BUY_TYPES:
         score += 1.5
-    elif tx_type in ("S", "SELL", "D"):
+    elif tx_type in SELL_TYPES:
         score += 0.5
 
     # Congress trade bonus (0-1 point)
-    if "congress" in trade.get("source", "").lower():
+    if "congress" in source_lower:
         score += 1.0
 
     return min(score, 10.0)
@@ -101,6 +210,7 @@ def filter_trades(
     min_value: int = 100_000,
     min_score: float = 2.0,
     watchlist: list[str] | None = None,
+    watchlist_set: frozenset[str] | None = None,
 ) -> list[dict[str, Any]]:
     """Filter and score a list of trades.
 
@@ -109,23 +219,34 @@ def filter_trades(
         min_value: Minimum trade value to include.
         min_score: Minimum interest score to include.
         watchlist: If set, also include any trade matching these tickers.
+        watchlist_set: Prebuilt set of uppercased watchlist tickers; takes
+            precedence over ``watchlist`` when given.
 
     Returns:
-        Filtered and scored trades, sorted by score descending.
+        Filtered and scored trades, sorted by score descending. Only trades
+        that could qualify are scored; the rest are left without a score.
     """
-    watchlist_set = {t.upper() for t in (watchlist or [])}
+    if watchlist_set is None:
+        watchlist_set = frozenset(t.upper() for t in (watchlist or []))
     scored_trades: list[dict[str, Any]] = []
 
     for trade in trades:
-        trade_score = score_trade(trade)
-        trade["score"] = trade_score
         value = trade.get("value", 0)
         ticker = trade.get("ticker", "").upper()
+        on_watchlist = ticker in watchlist_set
+
+        # Below the value floor only watchlist trades can qualify, so skip
+        # scoring everything else outright.
+        if value < min_value and not on_watchlist:
+            continue
+
+        trade_score = score_trade(trade)
+        trade["score"] = trade_score
 
-        if (value >= min_value and trade_score >= min_score) or ticker in watchlist_set:
+        if trade_score >= min_score or on_watchlist:
             scored_trades.append(trade)
 
-    scored_trades.sort(key=lambda t: t.get("score", 0), reverse=True)
+    scored_trades.sort(key=itemgetter("score"), reverse=True)
 
     logger.info(
         "Filtered %d trades down to %d (min_value=%d, min_score=%.1f)",
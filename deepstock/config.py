@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Optional
 
 from dotenv import load_dotenv
@@ -37,11 +38,17 @@ class Settings:
     scan_interval_minutes: int = 30
     min_trade_value: int = 100_000
     watchlist: list[str] = field(default_factory=lambda: ["AAPL", "MSFT", "NVDA", "TSLA", "AMD", "GOOGL"])
+    alert_per_trade: bool = False
 
     # AI settings
     ai_provider: str = "openai"
     ai_model: str = "gpt-4"
 
+    @cached_property
+    def watchlist_set(self) -> frozenset[str]:
+        """Uppercased watchlist tickers, built once for repeated filtering."""
+        return frozenset(t.upper() for t in self.watchlist)
+
     @property
     def has_data_source(self) -> bool:
         """Check if at least one data source is configured."""
@@ -127,6 +134,7 @@ def load_settings(env_path: Optional[str] = None) -> Settings:
         scan_interval_minutes=int(os.getenv("SCAN_INTERVAL_MINUTES", "30")),
         min_trade_value=int(os.getenv("MIN_TRADE_VALUE", "100000")),
         watchlist=watchlist,
+        alert_per_trade=os.getenv("ALERT_PER_TRADE", "false").strip().lower() in ("1", "true", "yes"),
         ai_provider=ai_provider,
         ai_model=ai_model,
     )
@@ -157,6 +165,7 @@ def print_config_status(settings: Settings) -> None:
     print(f"  Interval:        {settings.scan_interval_minutes} minutes")
     print(f"  Min trade value: ${settings.min_trade_value:,}")
     print(f"  Watchlist:       {', '.join(settings.watchlist)}")
+    print(f"  Alert mode:      {'one message per trade' if settings.alert_per_trade else 'batched'}")
 
     issues = settings.validate()
     if issues:
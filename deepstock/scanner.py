@@ -4,12 +4,14 @@ from __future__ import annotations
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from typing import Any, Optional
 
 from deepstock.config import Settings
 from deepstock.sources import fmp, finnhub, edgar
-from deepstock.analysis.filter import filter_trades
-from deepstock.analysis.ai_analyst import analyze_trade, detect_patterns
+from deepstock.analysis.filter import dedupe_trades, filter_trades, normalize_trade
+from deepstock.analysis.ai_analyst import analyze_trades, detect_patterns
 from deepstock.alerts import telegram, email, formatter
 
 logger = logging.getLogger(__name__)
@@ -30,24 +32,22 @@ class DeepStockScanner:
             datefmt="%Y-%m-%d %H:%M:%S",
         )
 
-    def fetch_all_trades(self) -> list[dict[str, Any]]:
-        """Fetch trades from all configured data sources."""
-        all_trades: list[dict[str, Any]] = []
-
-        if self.settings.fmp_api_key:
-            logger.info("Fetching insider trades from FMP...")
-            trades = fmp.fetch_insider_trades(self.settings.fmp_api_key)
-            all_trades.extend(trades)
+    def _fetch_fmp_trades(self) -> list[dict[str, Any]]:
+        """Fetch insider trades from FMP."""
+        logger.info("Fetching insider trades from FMP...")
+        return fmp.fetch_insider_trades(self.settings.fmp_api_key or "")
 
-        if self.settings.finnhub_api_key:
-            logger.info("Fetching congress trades from Finnhub...")
-            trades = finnhub.fetch_congress_trades(self.settings.finnhub_api_key)
-            all_trades.extend(trades)
+    def _fetch_finnhub_trades(self) -> list[dict[str, Any]]:
+        """Fetch congress trades from Finnhub."""
+        logger.info("Fetching congress trades from Finnhub...")
+        return finnhub.fetch_congress_trades(self.settings.finnhub_api_key or "")
 
+    def _fetch_edgar_trades(self) -> list[dict[str, Any]]:
+        """Fetch Form 4 filings from SEC EDGAR as trade records."""
         logger.info("Fetching Form 4 filings from SEC EDGAR...")
         filings = edgar.fetch_latest_form4_filings()
-        for filing in filings:
-            all_trades.append({
+        return [
+            {
                 "source": "edgar",
                 "ticker": filing.get("ticker", ""),
                 "insider_name": filing.get("title", ""),
@@ -58,8 +58,37 @@ class DeepStockScanner:
                 "value": 0,
                 "date": filing.get("updated", ""),
                 "filing_date": filing.get("updated", ""),
-                "raw": filing,
-            })
+            }
+            for filing in filings
+        ]
+
+    def fetch_all_trades(self) -> list[dict[str, Any]]:
+        """Fetch trades from all configured data sources.
+
+        Sources are fetched concurrently, so the wall time is that of the
+        slowest source rather than the sum of all of them. Trades reported
+        by more than one source are collapsed into one.
+        """
+        fetchers = []
+        if self.settings.fmp_api_key:
+            fetchers.append(self._fetch_fmp_trades)
+        if self.settings.finnhub_api_key:
+            fetchers.append(self._fetch_finnhub_trades)
+        fetchers.append(self._fetch_edgar_trades)
+
+        fetched: list[dict[str, Any]] = []
+
+        if len(fetchers) == 1:
+            fetched.extend(fetchers[0]())
+        else:
+            with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+                futures = [executor.submit(fetch) for fetch in fetchers]
+                for future in futures:
+                    fetched.extend(future.result())
+
+        all_trades = dedupe_trades(fetched)
+        for trade in all_trades:
+            normalize_trade(trade)
 
         logger.info("Total trades fetched: %d", len(all_trades))
         return all_trades
@@ -73,6 +102,7 @@ class DeepStockScanner:
         logger.info("=" * 50)
         logger.info("Starting deepstock scan...")
         logger.info("=" * 50)
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
         # 1. Fetch
         all_trades = self.fetch_all_trades()
@@ -81,7 +111,7 @@ class DeepStockScanner:
         filtered = filter_trades(
             all_trades,
             min_value=self.settings.min_trade_value,
-            watchlist=self.settings.watchlist,
+            watchlist_set=self.settings.watchlist_set,
         )
 
         if not filtered:
@@ -95,76 +125,50 @@ class DeepStockScanner:
         ai_key = self.settings.openai_api_key or self.settings.anthropic_api_key or ""
 
         if ai_key and self.settings.has_ai_provider:
-            for trade in filtered[:5]:
-                analysis = analyze_trade(
-                    trade,
-                    provider=self.settings.ai_provider,
-                    api_key=ai_key,
-                    model=self.settings.ai_model,
+            llm_args: dict[str, Any] = {
+                "provider": self.settings.ai_provider,
+                "api_key": ai_key,
+                "model": self.settings.ai_model,
+            }
+            # Pattern detection is independent of the per-trade analyses, so
+            # its request runs alongside them rather than after them.
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                patterns_future = (
+                    executor.submit(detect_patterns, filtered, **llm_args)
+                    if len(filtered) >= 3 else None
                 )
+                analyses = analyze_trades(filtered[:5], **llm_args)
+                patterns = patterns_future.result() if patterns_future else None
+
+            for trade, analysis in zip(filtered[:5], analyses):
                 trade["ai_analysis"] = analysis
                 analyzed_trades.append(trade)
-
-            patterns = detect_patterns(
-                filtered,
-                provider=self.settings.ai_provider,
-                api_key=ai_key,
-                model=self.settings.ai_model,
-            ) if len(filtered) >= 3 else None
         else:
             analyzed_trades = filtered[:5]
             patterns = None
             logger.warning("No AI provider configured — skipping analysis")
 
-        # 4. Send alerts
-        alerts_sent = 0
+        # 4. Send alerts (Telegram and email are delivered concurrently)
+        alerts = [
+            (trade, formatter.format_breaking_alert(trade, trade.get("ai_analysis")))
+            for trade in analyzed_trades
+        ]
+        digest_html = formatter.format_daily_digest(filtered, patterns, today=today) if len(filtered) >= 2 else None
 
-        for trade in analyzed_trades:
-            alert_html = formatter.format_breaking_alert(trade, trade.get("ai_analysis"))
-
-            if self.settings.has_telegram:
-                if telegram.send_message(
-                    self.settings.telegram_bot_token,
-                    self.settings.telegram_chat_id,
-                    alert_html,
-                ):
-                    alerts_sent += 1
-
-            if self.settings.has_email:
-                headline = (trade.get("ai_analysis") or {}).get("headline", "")
-                subject = f"🚨 Insider Trade: {trade.get('ticker', '???')} — {headline or 'Notable Activity'}"
-                if email.send_email(
-                    smtp_host=self.settings.smtp_host,
-                    smtp_port=self.settings.smtp_port,
-                    smtp_user=self.settings.smtp_user,
-                    smtp_password=self.settings.smtp_password,
-                    to_address=self.settings.alert_email_to,
-                    subject=subject,
-                    body_html=alert_html,
-                ):
-                    alerts_sent += 1
-
-        # Daily digest
-        if len(filtered) >= 2:
-            digest_html = formatter.format_daily_digest(filtered, patterns)
-
-            if self.settings.has_telegram:
-                telegram.send_message(
-                    self.settings.telegram_bot_token,
-                    self.settings.telegram_chat_id,
-                    digest_html,
-                )
+        channels = []
+        if self.settings.has_telegram:
+            channels.append(self._send_telegram_alerts)
+        if self.settings.has_email:
+            channels.append(self._send_email_alerts)
 
-            if self.settings.has_email:
-                email.send_email(
-                    smtp_host=self.settings.smtp_host,
-                    smtp_port=self.settings.smtp_port,
-                    smtp_user=self.settings.smtp_user,
-                    smtp_password=self.settings.smtp_password,
-                    to_address=self.settings.alert_email_to,
-                    subject=f"📊 DeepStock Daily Digest — {len(filtered)} Notable Trades",
-                    body_html=digest_html,
-                )
+        alerts_sent = 0
+        if channels:
+            with ThreadPoolExecutor(max_workers=len(channels)) as executor:
+                futures = [
+                    executor.submit(send, alerts, digest_html, len(filtered))
+                    for send in channels
+                ]
+                alerts_sent = sum(future.result() for future in futures)
 
         results = {
             "trades_fetched": len(all_trades),
@@ -177,6 +181,82 @@ class DeepStockScanner:
         logger.info("Scan complete: %s", results)
         return results
 
+    def _send_telegram_alerts(
+        self,
+        alerts: list[tuple[dict[str, Any], str]],
+        digest_html: Optional[str],
+        trade_count: int,
+    ) -> int:
+        """Send trade alerts, then the digest, via Telegram.
+
+        Alerts go out as one combined message unless ``alert_per_trade``
+        is set.
+
+        Returns:
+            Number of trade alerts delivered.
+        """
+        token = self.settings.telegram_bot_token or ""
+        chat_id = self.settings.telegram_chat_id or ""
+        sent = 0
+
+        if self.settings.alert_per_trade:
+            results = telegram.send_messages(token, chat_id, [alert_html for _, alert_html in alerts])
+            sent = sum(results)
+        elif alerts:
+            batch_html = formatter.format_alert_batch([alert_html for _, alert_html in alerts])
+            if telegram.send_message(token, chat_id, batch_html):
+                sent = len(alerts)
+
+        if digest_html:
+            telegram.send_message(token, chat_id, digest_html)
+
+        return sent
+
+    def _send_email_alerts(
+        self,
+        alerts: list[tuple[dict[str, Any], str]],
+        digest_html: Optional[str],
+        trade_count: int,
+    ) -> int:
+        """Send trade alerts, then the digest, over one SMTP session.
+
+        Alerts go out as one combined email unless ``alert_per_trade`` is
+        set.
+
+        Returns:
+            Number of trade alerts delivered.
+        """
+        to_address = self.settings.alert_email_to or ""
+        sent = 0
+
+        with email.SMTPSession(
+            smtp_host=self.settings.smtp_host,
+            smtp_port=self.settings.smtp_port,
+            smtp_user=self.settings.smtp_user or "",
+            smtp_password=self.settings.smtp_password or "",
+        ) as smtp:
+            if self.settings.alert_per_trade:
+                for trade, alert_html in alerts:
+                    headline = (trade.get("ai_analysis") or {}).get("headline", "")
+                    subject = f"🚨 Insider Trade: {trade.get('ticker', '???')} — {headline or 'Notable Activity'}"
+                    if smtp.send(to_address=to_address, subject=subject, body_html=alert_html):
+                        sent += 1
+            elif alerts:
+                tickers = ", ".join(dict.fromkeys(trade.get("ticker", "???") for trade, _ in alerts))
+                subject = f"🚨 {len(alerts)} Insider Trades: {tickers}"
+                batch_html = formatter.format_alert_batch([alert_html for _, alert_html in alerts])
+                if smtp.send(to_address=to_address, subject=subject, body_html=batch_html):
+                    sent = len(alerts)
+
+            if digest_html:
+                smtp.send(
+                    to_address=to_address,
+                    subject=f"📊 DeepStock Daily Digest — {trade_count} Notable Trades",
+                    body_html=digest_html,
+                )
+
+        return sent
+
     def watch(self) -> None:
         """Run continuous monitoring at configured intervals."""
         import schedule
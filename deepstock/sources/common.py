@@ -0,0 +1,87 @@
+"""Shared HTTP plumbing for data source clients."""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def create_session(headers: Optional[dict[str, str]] = None) -> requests.Session:
+    """Create a pooled HTTP session with retries for a data source.
+
+    Connections to the source's host are kept alive between requests, and
+    idempotent GETs are retried with backoff on 429 and 5xx responses.
+    After the last retry the final response is returned as-is, so callers'
+    ``raise_for_status`` handling is unchanged.
+
+    Args:
+        headers: Default headers to send with every request.
+
+    Returns:
+        Configured requests session.
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry))
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+def date_range(days: int) -> tuple[str, str]:
+    """Return the ISO dates spanning the last ``days`` days, in UTC.
+
+    Args:
+        days: Number of days to look back.
+
+    Returns:
+        ``(date_from, date_to)`` as YYYY-MM-DD strings.
+    """
+    today = datetime.now(timezone.utc).date()
+    return (today - timedelta(days=days)).isoformat(), today.isoformat()
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter.
+
+    Allows bursts of up to ``capacity`` requests and refills continuously at
+    ``rate`` tokens per second, so a caller that is already slower than the
+    limit never sleeps.
+
+    Args:
+        rate: Tokens added per second.
+        capacity: Maximum number of tokens the bucket holds.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until it is available if necessary."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # The token is reserved now (possibly going negative), so
+            # concurrent callers queue up behind it without holding the lock.
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import io
 import logging
 import re
 import xml.etree.ElementTree as ET
@@ -9,16 +10,74 @@ from typing import Any, Optional
 
 import requests
 
+from deepstock import jsonutil
+from deepstock.sources.common import TokenBucket, create_session, date_range
+
 logger = logging.getLogger(__name__)
 
 HEADERS = {
     "User-Agent": "deepstock-bot/0.1.0 (https://github.com/bernhardbrugger/deepstock-bot)",
     "Accept": "application/atom+xml",
+    "Accept-Encoding": "gzip, deflate",
 }
 
+_SESSION = create_session(HEADERS)
+
+# SEC fair-access policy: at most 10 requests per second
+_BUCKET = TokenBucket(rate=10.0, capacity=10)
+
+# Form 4 filing page fields: the value span following a numbered label span
+_NAME_FIELD_RE = re.compile(
+    r'<span class="FormData">\s*1\.\s*Name.*?</span>.*?'
+    r'<span class="FormData">(.+?)</span>',
+    re.DOTALL,
+)
+_TICKER_FIELD_RE = re.compile(
+    r'<span class="FormData">\s*3\.\s*Ticker.*?</span>.*?'
+    r'<span class="FormData">(.+?)</span>',
+    re.DOTALL,
+)
+
+# Transaction table: rows are located first, then each row is matched on its
+# own so a match can never stitch cells from neighbouring rows together
+_ROW_RE = re.compile(r"<tr[^>]*>(.*?)</tr>", re.DOTALL | re.IGNORECASE)
+_TX_CELLS_RE = re.compile(
+    r"<td[^>]*>\s*(\d{2}/\d{2}/\d{4})\s*</td>.*?"
+    r"<td[^>]*>\s*([PSMADFGCW])\s*</td>.*?"
+    r"<td[^>]*>\s*([\d,]+)\s*</td>.*?"
+    r"<td[^>]*>\s*\$?([\d,.]+)\s*</td>",
+    re.DOTALL,
+)
+
+SEARCH_URL = "https://efts.sec.gov/LATEST/search-index"
+
+# Issuer ticker in an atom feed title, e.g. "Apple Inc. (AAPL)"
+_TICKER_RE = re.compile(r"\(([A-Z]{1,5})\)")
+# Company name in an atom feed title, e.g. "4 - Apple Inc. (0000320193) (Issuer)"
+_COMPANY_RE = re.compile(r"4\s*-\s*(.+?)\s*\(")
+# Ticker group of a search display name: "(AAPL)", "(GOOGL, GOOG)", "(BRK-B, BRK-A)"
+_TICKERS = r"[A-Z][A-Z0-9.\-]*(?:,\s*[A-Z][A-Z0-9.\-]*)*"
+_DISPLAY_TICKERS_RE = re.compile(rf"\(({_TICKERS})\)")
+# Trailing ticker and "(CIK 0000320193)" groups of a search display name
+_DISPLAY_SUFFIX_RE = re.compile(rf"\s*\((?:{_TICKERS}|CIK \d+)\)")
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_ATOM_ENTRY = f"{_ATOM}entry"
+_ATOM_TITLE = f"{_ATOM}title"
+_ATOM_LINK = f"{_ATOM}link"
+_ATOM_UPDATED = f"{_ATOM}updated"
+_ATOM_SUMMARY = f"{_ATOM}summary"
+
+# Feed URL -> (conditional request headers, filings parsed from that response)
+_FEED_CACHE: dict[str, tuple[dict[str, str], list[dict[str, Any]]]] = {}
+
 
 def fetch_latest_form4_filings(count: int = 40) -> list[dict[str, Any]]:
-    """Fetch the latest Form 4 filings from SEC EDGAR RSS feed.
+    """Fetch the latest Form 4 filings from SEC EDGAR.
+
+    Filings are read from the real-time atom feed. If the feed cannot be
+    fetched or parsed, recent filings from the EDGAR full-text search
+    endpoint are used instead.
 
     Args:
         count: Number of filings to fetch (max 40 per request).
@@ -30,47 +89,157 @@ def fetch_latest_form4_filings(count: int = 40) -> list[dict[str, Any]]:
         SEC EDGAR requires a descriptive User-Agent header.
         No API key is needed.
     """
+    count = min(count, 40)
+    filings = _fetch_form4_feed(count)
+    if filings is None:
+        filings = _fetch_form4_search(count)
+    return filings if filings is not None else []
+
+
+def _fetch_form4_search(count: int) -> Optional[list[dict[str, Any]]]:
+    """Fetch recent Form 4 filings from the full-text search endpoint.
+
+    The endpoint has no "latest first" ordering: this reads one page of
+    hits from the last few days, sorted by filing day. It is a fallback for
+    when the atom feed is unavailable, not a replacement for it.
+
+    Returns:
+        Filing summaries, or None if the endpoint could not be used.
+    """
+    # A few days back so weekends and holidays still return filings
+    start, end = date_range(3)
+    params = {
+        "forms": "4",
+        "dateRange": "custom",
+        "startdt": start,
+        "enddt": end,
+    }
+
+    _BUCKET.acquire()
+    try:
+        response = _SESSION.get(SEARCH_URL, params=params, headers={"Accept": "application/json"}, timeout=30)
+        response.raise_for_status()
+        hits = jsonutil.loads(response.content)["hits"]["hits"]
+    except requests.exceptions.RequestException as e:
+        logger.error("EDGAR search request failed: %s", e)
+        return None
+    except (ValueError, KeyError, TypeError) as e:
+        logger.error("Unexpected EDGAR search response: %s", e)
+        return None
+
+    filings = []
+    for hit in hits:
+        source = hit.get("_source") or {}
+        names = source.get("display_names") or []
+        ciks = source.get("ciks") or []
+        adsh = source.get("adsh") or hit.get("_id", "").split(":")[0]
+
+        # The issuer is the display name carrying a ticker; the others are
+        # the reporting owners
+        ticker = ""
+        company = ""
+        for name in names:
+            tickers_match = _DISPLAY_TICKERS_RE.search(name)
+            if tickers_match:
+                ticker = tickers_match.group(1).split(",")[0].strip()
+                company = _DISPLAY_SUFFIX_RE.sub("", name).strip()
+                break
+
+        link = ""
+        if adsh and ciks:
+            link = (
+                f"https://www.sec.gov/Archives/edgar/data/{ciks[0].lstrip('0')}/"
+                f"{adsh.replace('-', '')}/{adsh}-index.htm"
+            )
+
+        filings.append({
+            "source": "edgar",
+            "title": "4 - " + "; ".join(_DISPLAY_SUFFIX_RE.sub("", n).strip() for n in names),
+            "link": link,
+            "updated": source.get("file_date", ""),
+            "summary": "",
+            "ticker": ticker,
+            "company": company,
+        })
+
+    filings.sort(key=lambda f: f["updated"], reverse=True)
+    filings = filings[:count]
+    logger.info("Fetched %d Form 4 filings from EDGAR search", len(filings))
+    return filings
+
+
+def _fetch_form4_feed(count: int) -> Optional[list[dict[str, Any]]]:
+    """Fetch the latest Form 4 filings from the EDGAR atom feed.
+
+    Repeat requests are conditional (ETag / Last-Modified), so an unchanged
+    feed comes back as an empty 304 and the previously parsed filings are
+    reused.
+
+    Returns:
+        Filing summaries, newest first, or None if the feed could not be
+        fetched or parsed.
+    """
     url = (
         f"https://www.sec.gov/cgi-bin/browse-edgar"
         f"?action=getcurrent&type=4&dateb=&owner=include"
-        f"&count={min(count, 40)}&search_text=&start=0&output=atom"
+        f"&count={count}&search_text=&start=0&output=atom"
     )
 
+    cached = _FEED_CACHE.get(url)
+
+    _BUCKET.acquire()
     try:
-        response = requests.get(url, headers=HEADERS, timeout=30)
+        response = _SESSION.get(url, headers=cached[0] if cached else None, timeout=30)
         response.raise_for_status()
     except requests.exceptions.RequestException as e:
         logger.error("Failed to fetch EDGAR RSS: %s", e)
-        return []
+        return None
 
-    try:
-        root = ET.fromstring(response.text)
-    except ET.ParseError as e:
-        logger.error("Failed to parse EDGAR RSS XML: %s", e)
-        return []
+    if response.status_code == 304 and cached:
+        logger.info("EDGAR feed unchanged, reusing %d cached filings", len(cached[1]))
+        return list(cached[1])
 
-    ns = {"atom": "http://www.w3.org/2005/Atom"}
     filings = []
 
-    for entry in root.findall("atom:entry", ns):
-        title = entry.findtext("atom:title", "", ns)
-        link_el = entry.find("atom:link", ns)
-        link = link_el.get("href", "") if link_el is not None else ""
-        updated = entry.findtext("atom:updated", "", ns)
-        summary = entry.findtext("atom:summary", "", ns)
+    # Stream the raw bytes through iterparse: the parser handles the declared
+    # encoding itself, and each entry is cleared once read.
+    try:
+        for _, entry in ET.iterparse(io.BytesIO(response.content), events=("end",)):
+            if entry.tag != _ATOM_ENTRY:
+                continue
 
-        ticker_match = re.search(r"\(([A-Z]{1,5})\)", title)
-        company_match = re.search(r"4\s*-\s*(.+?)\s*\(", title)
+            title = entry.findtext(_ATOM_TITLE, "")
+            link_el = entry.find(_ATOM_LINK)
+            link = link_el.get("href", "") if link_el is not None else ""
+            updated = entry.findtext(_ATOM_UPDATED, "")
+            summary = entry.findtext(_ATOM_SUMMARY, "")
+            entry.clear()
 
-        filings.append({
-            "source": "edgar",
-            "title": title.strip(),
-            "link": link,
-            "updated": updated,
-            "summary": summary.strip() if summary else "",
-            "ticker": ticker_match.group(1) if ticker_match else "",
-            "company": company_match.group(1).strip() if company_match else "",
-        })
+            ticker_match = _TICKER_RE.search(title)
+            company_match = _COMPANY_RE.search(title)
+
+            filings.append({
+                "source": "edgar",
+                "title": title.strip(),
+                "link": link,
+                "updated": updated,
+                "summary": summary.strip() if summary else "",
+                "ticker": ticker_match.group(1) if ticker_match else "",
+                "company": company_match.group(1).strip() if company_match else "",
+            })
+    except ET.ParseError as e:
+        logger.error("Failed to parse EDGAR RSS XML: %s", e)
+        return None
+
+    validators = {}
+    if response.headers.get("ETag"):
+        validators["If-None-Match"] = response.headers["ETag"]
+    if response.headers.get("Last-Modified"):
+        validators["If-Modified-Since"] = response.headers["Last-Modified"]
+    if validators:
+        _FEED_CACHE[url] = (validators, list(filings))
+    else:
+        _FEED_CACHE.pop(url, None)
 
     logger.info("Fetched %d Form 4 filings from EDGAR", len(filings))
     return filings
@@ -85,8 +254,9 @@ def parse_filing(url: str) -> Optional[dict[str, Any]]:
     Returns:
         Parsed filing data or None on failure.
     """
+    _BUCKET.acquire()
     try:
-        response = requests.get(url, headers={**HEADERS, "Accept": "text/html"}, timeout=30)
+        response = _SESSION.get(url, headers={"Accept": "text/html"}, timeout=30)
         response.raise_for_status()
     except requests.exceptions.RequestException as e:
         logger.error("Failed to fetch filing %s: %s", url, e)
@@ -94,26 +264,15 @@ def parse_filing(url: str) -> Optional[dict[str, Any]]:
 
     html = response.text
 
-    insider_match = re.search(
-        r'<span class="FormData">\s*1\.\s*Name.*?</span>.*?'
-        r'<span class="FormData">(.+?)</span>',
-        html, re.DOTALL
-    )
-    ticker_match = re.search(
-        r'<span class="FormData">\s*3\.\s*Ticker.*?</span>.*?'
-        r'<span class="FormData">(.+?)</span>',
-        html, re.DOTALL
-    )
+    insider_match = _NAME_FIELD_RE.search(html)
+    ticker_match = _TICKER_FIELD_RE.search(html)
 
     transactions: list[dict[str, Any]] = []
-    tx_pattern = re.findall(
-        r"<td.*?>\s*(\d{2}/\d{2}/\d{4})\s*</td>.*?"
-        r"<td.*?>\s*([PSMADFGCW])\s*</td>.*?"
-        r"<td.*?>\s*([\d,]+)\s*</td>.*?"
-        r"<td.*?>\s*\$?([\d,.]+)\s*</td>",
-        html, re.DOTALL
-    )
-    for date_str, code, shares_str, price_str in tx_pattern:
+    for row in _ROW_RE.finditer(html):
+        tx_match = _TX_CELLS_RE.search(row.group(1))
+        if not tx_match:
+            continue
+        date_str, code, shares_str, price_str = tx_match.groups()
         try:
             shares = int(shares_str.replace(",", ""))
             price = float(price_str.replace(",", ""))
@@ -3,40 +3,34 @@
 from __future__ import annotations
 
 import logging
-import time
-from datetime import datetime, timedelta
 from typing import Any, Optional
 
 import requests
 
+from deepstock import jsonutil
+from deepstock.sources.common import TokenBucket, create_session, date_range
+
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://finnhub.io/api/v1"
 
-_last_request_time: float = 0
-_MIN_REQUEST_INTERVAL: float = 1.0
-
+_SESSION = create_session()
 
-def _rate_limit() -> None:
-    """Enforce rate limiting between API calls."""
-    global _last_request_time
-    elapsed = time.time() - _last_request_time
-    if elapsed < _MIN_REQUEST_INTERVAL:
-        time.sleep(_MIN_REQUEST_INTERVAL - elapsed)
-    _last_request_time = time.time()
+# Finnhub free tier: 60 requests per minute
+_BUCKET = TokenBucket(rate=1.0, capacity=1)
 
 
 def _get(endpoint: str, api_key: str, params: Optional[dict[str, Any]] = None) -> Any:
     """Make a rate-limited GET request to Finnhub API."""
-    _rate_limit()
+    _BUCKET.acquire()
     all_params = {"token": api_key}
     if params:
         all_params.update(params)
 
     try:
-        response = requests.get(f"{BASE_URL}/{endpoint}", params=all_params, timeout=30)
+        response = _SESSION.get(f"{BASE_URL}/{endpoint}", params=all_params, timeout=30)
         response.raise_for_status()
-        return response.json()
+        return jsonutil.loads(response.content)
     except requests.exceptions.Timeout:
         logger.error("Finnhub API request timed out: %s", endpoint)
         return None
@@ -51,11 +45,12 @@ def _get(endpoint: str, api_key: str, params: Optional[dict[str, Any]] = None) -
         return None
 
 
-def fetch_congress_trades(api_key: str) -> list[dict[str, Any]]:
+def fetch_congress_trades(api_key: str, include_raw: bool = False) -> list[dict[str, Any]]:
     """Fetch recent Congressional trading activity.
 
     Args:
         api_key: Finnhub API key.
+        include_raw: Keep the original API record under ``"raw"``.
 
     Returns:
         List of congress trade records.
@@ -72,7 +67,7 @@ def fetch_congress_trades(api_key: str) -> list[dict[str, Any]]:
         except (ValueError, TypeError):
             estimated_value = 0
 
-        trades.append({
+        trade = {
             "source": "finnhub_congress",
             "ticker": item.get("symbol", ""),
             "insider_name": item.get("name", ""),
@@ -83,8 +78,10 @@ def fetch_congress_trades(api_key: str) -> list[dict[str, Any]]:
             "value": estimated_value,
             "date": item.get("transactionDate", ""),
             "filing_date": item.get("filingDate", ""),
-            "raw": item,
-        })
+        }
+        if include_raw:
+            trade["raw"] = item
+        trades.append(trade)
 
     logger.info("Fetched %d congress trades from Finnhub", len(trades))
     return trades
@@ -119,8 +116,7 @@ def fetch_company_news(
     Returns:
         List of news articles.
     """
-    date_from = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
-    date_to = datetime.utcnow().strftime("%Y-%m-%d")
+    date_from, date_to = date_range(days)
 
     data = _get("company-news", api_key, {
         "symbol": ticker.upper(),
@@ -3,37 +3,31 @@
 from __future__ import annotations
 
 import logging
-import time
-from datetime import datetime, timedelta
 from typing import Any, Optional
 
 import requests
 
+from deepstock import jsonutil
+from deepstock.sources.common import TokenBucket, create_session, date_range
+
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://financialmodelingprep.com/api/v4"
 BASE_URL_V3 = "https://financialmodelingprep.com/api/v3"
 
-_last_request_time: float = 0
-_MIN_REQUEST_INTERVAL: float = 0.5
-
+_SESSION = create_session()
 
-def _rate_limit() -> None:
-    """Enforce rate limiting between API calls."""
-    global _last_request_time
-    elapsed = time.time() - _last_request_time
-    if elapsed < _MIN_REQUEST_INTERVAL:
-        time.sleep(_MIN_REQUEST_INTERVAL - elapsed)
-    _last_request_time = time.time()
+# Client-side rate limit: at most 2 requests per second
+_BUCKET = TokenBucket(rate=2.0, capacity=2)
 
 
 def _get(url: str, params: dict[str, Any]) -> Any:
     """Make a rate-limited GET request to FMP API."""
-    _rate_limit()
+    _BUCKET.acquire()
     try:
-        response = requests.get(url, params=params, timeout=30)
+        response = _SESSION.get(url, params=params, timeout=30)
         response.raise_for_status()
-        return response.json()
+        return jsonutil.loads(response.content)
     except requests.exceptions.Timeout:
         logger.error("FMP API request timed out: %s", url)
         return []
@@ -52,6 +46,7 @@ def fetch_insider_trades(
     api_key: str,
     days: int = 7,
     page: int = 0,
+    include_raw: bool = False,
 ) -> list[dict[str, Any]]:
     """Fetch recent insider trades from FMP.
 
@@ -59,12 +54,12 @@ def fetch_insider_trades(
         api_key: FMP API key.
         days: Number of days to look back.
         page: Pagination page number.
+        include_raw: Keep the original API record under ``"raw"``.
 
     Returns:
         List of insider trade records.
     """
-    date_from = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
-    date_to = datetime.utcnow().strftime("%Y-%m-%d")
+    date_from, date_to = date_range(days)
 
     data = _get(f"{BASE_URL}/insider-trading", {
         "apikey": api_key,
@@ -77,21 +72,31 @@ def fetch_insider_trades(
         logger.warning("Unexpected FMP insider trades response: %s", type(data))
         return []
 
+    # Consume the decoded rows while converting them, so each source dict
+    # can be freed as soon as its trade record exists instead of both full lists
+    # being alive at once. Reversed first so pop() keeps the API order.
     trades = []
-    for item in data:
-        trades.append({
+    data.reverse()
+    while data:
+        item = data.pop()
+        get = item.get
+        shares = get("securitiesTransacted") or 0
+        price = get("price") or 0
+        trade = {
             "source": "fmp",
-            "ticker": item.get("symbol", ""),
-            "insider_name": item.get("reportingName", ""),
-            "insider_title": item.get("typeOfOwner", ""),
-            "transaction_type": item.get("acquistionOrDisposition", ""),
-            "shares": item.get("securitiesTransacted", 0),
-            "price": item.get("price", 0),
-            "value": item.get("securitiesTransacted", 0) * item.get("price", 0),
-            "date": item.get("transactionDate", ""),
-            "filing_date": item.get("filingDate", ""),
-            "raw": item,
-        })
+            "ticker": get("symbol", ""),
+            "insider_name": get("reportingName", ""),
+            "insider_title": get("typeOfOwner", ""),
+            "transaction_type": get("acquistionOrDisposition", ""),
+            "shares": shares,
+            "price": price,
+            "value": shares * price,
+            "date": get("transactionDate", ""),
+            "filing_date": get("filingDate", ""),
+        }
+        if include_raw:
+            trade["raw"] = item
+        trades.append(trade)
 
     logger.info("Fetched %d insider trades from FMP (last %d days)", len(trades), days)
     return trades
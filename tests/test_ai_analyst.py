@@ -0,0 +1,52 @@
+"""Tests for AI analyst prompt rendering."""
+
+from __future__ import annotations
+
+import pytest
+
+from deepstock.analysis.ai_analyst import (
+    TRADE_ANALYSIS_PROMPT,
+    _TRADE_PROMPT_SEGMENTS,
+    _compile_template,
+    _render_template,
+)
+
+
+@pytest.mark.parametrize("values", [
+    {
+        "insider_name": "Lisa Su",
+        "insider_title": "CEO",
+        "ticker": "AMD",
+        "transaction_type": "P",
+        "shares": 50_000,
+        "price": 142.3,
+        "value": 7_115_000.0,
+        "date": "2026-02-15",
+        "context": "",
+    },
+    {
+        "insider_name": "Hon. Nancy Pelosi",
+        "insider_title": "Congress — House",
+        "ticker": "NVDA",
+        "transaction_type": "Purchase",
+        "shares": 0,
+        "price": 0,
+        "value": 1_000_001,
+        "date": "Unknown",
+        "context": "ADDITIONAL CONTEXT:\nEarnings next week {not a field}",
+    },
+])
+def test_render_template_matches_str_format(values):
+    assert _render_template(_TRADE_PROMPT_SEGMENTS, **values) == TRADE_ANALYSIS_PROMPT.format(**values)
+
+
+def test_render_template_handles_escaped_braces_and_trailing_literal():
+    template = "{{literal}} {a:>5} and {b:.1f}% done"
+    values = {"a": "x", "b": 12.345}
+
+    assert _render_template(_compile_template(template), **values) == template.format(**values)
+
+
+def test_render_template_missing_field_raises():
+    with pytest.raises(KeyError):
+        _render_template(_compile_template("{a} {b}"), a=1)
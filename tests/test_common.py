@@ -0,0 +1,84 @@
+"""Tests for the shared data source helpers."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from deepstock.sources import common
+
+
+class FakeClock:
+    """Monotonic clock that only advances when slept on or moved by hand."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(common.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(common.time, "sleep", fake.sleep)
+    return fake
+
+
+def test_token_bucket_allows_burst_up_to_capacity(clock):
+    bucket = common.TokenBucket(rate=2.0, capacity=2)
+
+    bucket.acquire()
+    bucket.acquire()
+
+    assert clock.sleeps == []
+
+
+def test_token_bucket_waits_for_refill_after_burst(clock):
+    bucket = common.TokenBucket(rate=2.0, capacity=2)
+
+    for _ in range(4):
+        bucket.acquire()
+
+    assert clock.sleeps == pytest.approx([0.5, 0.5])
+
+
+def test_token_bucket_does_not_sleep_for_slow_callers(clock):
+    bucket = common.TokenBucket(rate=1.0, capacity=1)
+
+    for _ in range(3):
+        bucket.acquire()
+        clock.now += 1.5
+
+    assert clock.sleeps == []
+
+
+def test_token_bucket_refill_is_capped_at_capacity(clock):
+    bucket = common.TokenBucket(rate=10.0, capacity=10)
+    clock.now += 60
+
+    for _ in range(11):
+        bucket.acquire()
+
+    assert clock.sleeps == pytest.approx([0.1])
+
+
+def test_token_bucket_queues_concurrent_callers():
+    bucket = common.TokenBucket(rate=50.0, capacity=1)
+    start = common.time.monotonic()
+
+    threads = [threading.Thread(target=bucket.acquire) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # One token up front, then five more at 50/s: at least 0.1s overall
+    assert common.time.monotonic() - start >= 0.09
@@ -0,0 +1,122 @@
+"""Tests for the SEC EDGAR Form 4 client."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+import requests
+
+from deepstock.sources import edgar
+
+FEED = b"""<?xml version="1.0" encoding="ISO-8859-1" ?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+<title>Latest Filings</title>
+<entry>
+<title>4 - Tesla, Inc. (TSLA) (0001318605) (Issuer)</title>
+<link rel="alternate" type="text/html" href="https://www.sec.gov/Archives/edgar/data/1318605/000131860526000001/0001318605-26-000001-index.htm"/>
+<summary type="html">&lt;b&gt;Filed:&lt;/b&gt; 2026-10-15</summary>
+<updated>2026-10-15T09:58:01-04:00</updated>
+</entry>
+<entry>
+<title>4 - Apple Inc. (0000320193) (Issuer)</title>
+<link rel="alternate" type="text/html" href="https://www.sec.gov/Archives/edgar/data/320193/000032019326000002/0000320193-26-000002-index.htm"/>
+<summary type="html">&lt;b&gt;Filed:&lt;/b&gt; 2026-10-15</summary>
+<updated>2026-10-15T09:50:00-04:00</updated>
+</entry>
+</feed>
+"""
+
+SEARCH = {"hits": {"hits": [
+    {
+        "_id": "0001214156-26-000010:wk-form4_1.xml",
+        "_source": {
+            "ciks": ["0001214156", "0000320193"],
+            "display_names": ["COOK TIMOTHY D  (CIK 0001214156)", "Apple Inc.  (AAPL)  (CIK 0000320193)"],
+            "file_date": "2026-10-13",
+            "adsh": "0001214156-26-000010",
+        },
+    },
+    {
+        "_id": "0001652044-26-000100:x.xml",
+        "_source": {
+            "ciks": ["0001652044"],
+            "display_names": ["Alphabet Inc.  (GOOGL, GOOG)  (CIK 0001652044)", "Pichai Sundar  (CIK 0001534753)"],
+            "file_date": "2026-10-14",
+        },
+    },
+    {
+        "_id": "0001067983-26-000005:x.xml",
+        "_source": {
+            "ciks": ["0001067983"],
+            "display_names": ["BERKSHIRE HATHAWAY INC  (BRK-B, BRK-A)  (CIK 0001067983)"],
+            "file_date": "2026-10-12",
+        },
+    },
+]}}
+
+
+class FakeResponse:
+    """Minimal requests.Response stand-in."""
+
+    def __init__(self, status_code: int, content: bytes = b"", headers: dict | None = None) -> None:
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} error")
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """Route EDGAR requests to canned responses, recording each call."""
+    state = {"feed": FakeResponse(200, FEED, {"ETag": '"v1"'}), "calls": []}
+
+    def get(url, params=None, headers=None, timeout=None):
+        state["calls"].append((url, headers))
+        if url == edgar.SEARCH_URL:
+            return FakeResponse(200, json.dumps(SEARCH).encode())
+        if headers and headers.get("If-None-Match") == '"v1"':
+            return FakeResponse(304)
+        return state["feed"]
+
+    monkeypatch.setattr(edgar._SESSION, "get", get)
+    monkeypatch.setattr(edgar, "_FEED_CACHE", {})
+    return state
+
+
+def test_feed_is_the_primary_source(server):
+    filings = edgar.fetch_latest_form4_filings()
+
+    assert [f["ticker"] for f in filings] == ["TSLA", ""]
+    assert filings[0]["company"] == "Tesla, Inc."
+    assert all(url != edgar.SEARCH_URL for url, _ in server["calls"])
+
+
+def test_unchanged_feed_reuses_parsed_filings(server):
+    first = edgar.fetch_latest_form4_filings()
+    second = edgar.fetch_latest_form4_filings()
+
+    assert second == first
+    assert server["calls"][1][1] == {"If-None-Match": '"v1"'}
+
+
+def test_search_is_used_when_feed_fails(server):
+    server["feed"] = FakeResponse(503)
+
+    filings = edgar.fetch_latest_form4_filings()
+
+    assert [(f["ticker"], f["company"]) for f in filings] == [
+        ("GOOGL", "Alphabet Inc."),
+        ("AAPL", "Apple Inc."),
+        ("BRK-B", "BERKSHIRE HATHAWAY INC"),
+    ]
+    assert filings[1]["link"].endswith("/1214156/000121415626000010/0001214156-26-000010-index.htm")
+
+
+def test_unparseable_feed_falls_back_to_search(server):
+    server["feed"] = FakeResponse(200, b"<feed><entry>")
+
+    assert [f["ticker"] for f in edgar.fetch_latest_form4_filings()] == ["GOOGL", "AAPL", "BRK-B"]
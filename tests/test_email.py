@@ -0,0 +1,91 @@
+"""Tests for the SMTP alert session."""
+
+from __future__ import annotations
+
+import smtplib
+
+import pytest
+
+from deepstock.alerts import email
+
+
+class FakeSMTP:
+    """Stand-in for smtplib.SMTP that records connections and messages."""
+
+    instances: list[FakeSMTP] = []
+    fail_login = False
+
+    def __init__(self, host: str, port: int, timeout: float = 30) -> None:
+        self.sent: list[str] = []
+        self.alive = True
+        self.closed = False
+        FakeSMTP.instances.append(self)
+
+    def starttls(self) -> None:
+        pass
+
+    def login(self, user: str, password: str) -> None:
+        if FakeSMTP.fail_login:
+            raise smtplib.SMTPAuthenticationError(535, b"bad credentials")
+
+    def noop(self) -> tuple[int, bytes]:
+        if not self.alive:
+            raise smtplib.SMTPServerDisconnected()
+        return 250, b"OK"
+
+    def send_message(self, msg) -> None:
+        self.sent.append(msg["Subject"])
+
+    def quit(self) -> None:
+        self.closed = True
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def fake_smtp(monkeypatch):
+    FakeSMTP.instances = []
+    FakeSMTP.fail_login = False
+    monkeypatch.setattr(email.smtplib, "SMTP", FakeSMTP)
+    return FakeSMTP
+
+
+def _session() -> email.SMTPSession:
+    return email.SMTPSession("smtp.example.com", 587, "user", "secret")
+
+
+def test_session_reuses_one_connection():
+    with _session() as session:
+        assert session.send("to@example.com", "first", "<b>1</b>")
+        assert session.send("to@example.com", "second", "<b>2</b>")
+
+    assert len(FakeSMTP.instances) == 1
+    assert FakeSMTP.instances[0].sent == ["first", "second"]
+    assert FakeSMTP.instances[0].closed
+
+
+def test_session_reconnects_after_disconnect():
+    with _session() as session:
+        assert session.send("to@example.com", "first", "<b>1</b>")
+        FakeSMTP.instances[0].alive = False
+        assert session.send("to@example.com", "second", "<b>2</b>")
+
+    assert len(FakeSMTP.instances) == 2
+    assert FakeSMTP.instances[1].sent == ["second"]
+
+
+def test_session_stops_after_authentication_failure():
+    FakeSMTP.fail_login = True
+
+    with _session() as session:
+        assert not session.send("to@example.com", "first", "<b>1</b>")
+        assert not session.send("to@example.com", "second", "<b>2</b>")
+
+    assert len(FakeSMTP.instances) == 1
+
+
+def test_send_email_opens_one_off_session():
+    assert email.send_email("smtp.example.com", 587, "user", "secret", "to@example.com", "subject", "<b>hi</b>")
+    assert FakeSMTP.instances[0].sent == ["subject"]
+    assert FakeSMTP.instances[0].closed
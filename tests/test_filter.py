@@ -0,0 +1,100 @@
+"""Tests for trade filtering and scoring."""
+
+from __future__ import annotations
+
+from deepstock.analysis.filter import dedupe_trades, filter_trades, normalize_trade, score_trade
+
+
+def _trade(**overrides):
+    trade = {
+        "source": "fmp",
+        "ticker": "AMD",
+        "insider_name": "Lisa Su",
+        "insider_title": "CEO",
+        "transaction_type": "P",
+        "shares": 50_000,
+        "price": 142.3,
+        "value": 7_115_000.0,
+        "date": "2026-02-15",
+        "filing_date": "2026-02-16",
+    }
+    trade.update(overrides)
+    return trade
+
+
+def test_score_trade_does_not_modify_trade():
+    trade = _trade()
+    before = dict(trade)
+
+    score_trade(trade)
+
+    assert trade == before
+
+
+def test_score_trade_same_with_and_without_normalization():
+    for trade in (
+        _trade(),
+        _trade(source="finnhub_congress", insider_name="Hon. Nancy Pelosi", transaction_type="Purchase"),
+        _trade(insider_title="VP Sales", transaction_type="S", value=600_000.0),
+    ):
+        assert score_trade(trade) == score_trade(normalize_trade(dict(trade)))
+
+
+def test_score_trade_follows_edited_fields():
+    trade = _trade()
+    buy_score = score_trade(trade)
+
+    trade["transaction_type"] = "S"
+
+    assert score_trade(trade) == buy_score - 1.0
+
+
+def test_filter_trades_keeps_watchlist_below_min_value():
+    trades = [
+        _trade(ticker="TINY", value=1_000.0),
+        _trade(ticker="NVDA", value=1_000.0),
+    ]
+
+    filtered = filter_trades(trades, min_value=100_000, watchlist=["nvda"])
+
+    assert [t["ticker"] for t in filtered] == ["NVDA"]
+
+
+def test_dedupe_keeps_acquisition_and_disposition_apart():
+    acquisition = _trade(ticker="AAPL", insider_name="Cook Timothy", transaction_type="A",
+                         shares=10_000, price=0, value=0.0)
+    disposition = _trade(ticker="AAPL", insider_name="Cook Timothy", transaction_type="D",
+                         shares=10_000, price=190.0, value=1_900_000.0)
+
+    unique = dedupe_trades([acquisition, disposition])
+
+    assert unique == [acquisition, disposition]
+    assert acquisition["transaction_type"] == "A" and acquisition["value"] == 0.0
+
+
+def test_dedupe_keeps_same_source_rows_that_look_identical():
+    congress = dict(source="finnhub_congress", ticker="NVDA", insider_name="Nancy Pelosi",
+                    transaction_type="Purchase", shares=0, price=0, value=1_000_001.0)
+    first, second = _trade(**congress), _trade(**congress)
+
+    assert dedupe_trades([first, second]) == [first, second]
+
+
+def test_dedupe_keeps_different_congress_trades_in_one_disclosure():
+    buy = _trade(source="finnhub_congress", ticker="NVDA", insider_name="Nancy Pelosi",
+                 transaction_type="Purchase", shares=0, value=1_000_001.0)
+    sale = _trade(source="finnhub_congress", ticker="NVDA", insider_name="Nancy Pelosi",
+                  transaction_type="Sale", shares=0, value=5_000_001.0)
+
+    assert dedupe_trades([buy, sale]) == [buy, sale]
+
+
+def test_dedupe_drops_trade_reported_by_another_source():
+    fmp = _trade(source="fmp", ticker="amd", insider_title="CEO")
+    other = _trade(source="other", ticker="AMD", insider_name="lisa su ", insider_title="",
+                   filing_date="2026-02-16T18:00:00")
+
+    unique = dedupe_trades([fmp, other])
+
+    assert unique == [fmp]
+    assert fmp["insider_title"] == "CEO" and fmp["source"] == "fmp"
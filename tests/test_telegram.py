@@ -0,0 +1,103 @@
+"""Tests for Telegram alert delivery."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from deepstock.alerts import telegram
+
+
+class FakeResponse:
+    """Minimal requests.Response stand-in."""
+
+    def __init__(self, status_code: int = 200, body: dict | None = None) -> None:
+        self.status_code = status_code
+        self.headers: dict[str, str] = {}
+        self._body = body if body is not None else {"ok": True}
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def json(self) -> dict:
+        return self._body
+
+
+@pytest.fixture
+def posts(monkeypatch):
+    sent: list[str] = []
+    replies: list[FakeResponse] = []
+
+    def post(url, json=None, timeout=None):
+        sent.append(json["text"])
+        return replies.pop(0) if replies else FakeResponse()
+
+    monkeypatch.setattr(telegram._SESSION, "post", post)
+    monkeypatch.setattr(telegram.time, "sleep", lambda seconds: None)
+    return sent, replies
+
+
+def test_send_messages_keeps_order(posts):
+    sent, _ = posts
+    texts = [f"alert {i}" for i in range(6)]
+
+    assert telegram.send_messages("token", "chat", texts) == [True] * 6
+    assert sent == texts
+
+
+def test_send_message_retries_after_rate_limit(posts):
+    sent, replies = posts
+    replies.append(FakeResponse(429, {"ok": False, "parameters": {"retry_after": 2}}))
+
+    assert telegram.send_message("token", "chat", "hello")
+    assert sent == ["hello", "hello"]
+
+
+def test_send_message_gives_up_on_long_retry_after(posts):
+    sent, replies = posts
+    replies.append(FakeResponse(429, {"ok": False, "parameters": {"retry_after": 3600}}))
+
+    assert not telegram.send_message("token", "chat", "hello")
+    assert sent == ["hello"]
+
+
+def _split_message_reference(text: str, max_length: int = 4000) -> list[str]:
+    """The original slice-and-strip splitter, kept as the behavioural reference."""
+    if len(text) <= max_length:
+        return [text]
+
+    chunks = []
+    while text:
+        if len(text) <= max_length:
+            chunks.append(text)
+            break
+        split_at = text.rfind("\n", 0, max_length)
+        if split_at == -1:
+            split_at = max_length
+        chunks.append(text[:split_at])
+        text = text[split_at:].lstrip("\n")
+
+    return chunks
+
+
+def test_split_message_matches_reference():
+    rng = random.Random(1234)
+    alphabet = "abc \n"
+
+    for _ in range(2000):
+        max_length = rng.randint(1, 40)
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 200)))
+        # The reference emits an empty first chunk for a leading newline;
+        # the index-based splitter deliberately does not.
+        text = text.lstrip("\n")
+        assert telegram._split_message(text, max_length) == _split_message_reference(text, max_length)
+
+
+def test_split_message_never_emits_empty_or_oversized_chunks():
+    text = "\n" + "\n".join("line %d %s" % (i, "x" * (i % 50)) for i in range(500))
+
+    chunks = telegram._split_message(text, max_length=100)
+
+    assert all(0 < len(chunk) <= 100 for chunk in chunks)
+    assert "".join(chunks).replace("\n", "") == text.replace("\n", "")